@@ -10,6 +10,8 @@ from tasky_projects.models import ProjectMetadata
 from tasky_projects.registry import ProjectRegistryService
 from tasky_settings import get_project_registry_service, get_settings, registry
 
+from tasky_cli.commands.tasks import reset_service_cache
+
 project_app = typer.Typer(no_args_is_help=True)
 
 
@@ -41,6 +43,8 @@ def init_command(
         _ensure_overwrite_allowed(config_file)
         config = _load_or_create_project_config(config_file, backend)
         config.to_file(config_file)
+        # Task commands run later in this process must see the new configuration
+        reset_service_cache()
         _echo_init_success(config, storage_root)
 
 
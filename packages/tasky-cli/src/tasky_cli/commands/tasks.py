@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
+import time
 from collections.abc import Callable
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import TypeVar, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uuid import UUID
 
 import click
@@ -15,17 +18,20 @@ import typer
 from tasky_hooks.errors import format_error_for_cli
 from tasky_settings import create_task_service, get_project_registry_service
 from tasky_settings.factory import find_project_root
-from tasky_tasks import (
-    ImportResult,
-    TaskFilter,
-    TaskImportExportService,
-    TaskModel,
-)
+from tasky_tasks import TaskFilter, TaskImportExportService
 from tasky_tasks.enums import TaskStatus
-from tasky_tasks.service import TaskService
 
 from tasky_cli.error_dispatcher import ErrorDispatcher
-from tasky_cli.validators import date_validator, status_validator, task_id_validator
+from tasky_cli.validators import (
+    INVALID_TASK_ID_MESSAGE,
+    ValidationResult,
+    date_validator,
+    status_validator,
+)
+
+if TYPE_CHECKING:
+    from tasky_tasks import ImportResult, TaskModel
+    from tasky_tasks.service import TaskService
 
 task_app = typer.Typer(no_args_is_help=True)
 
@@ -33,7 +39,30 @@ F = TypeVar("F", bound=Callable[..., object])
 
 logger = logging.getLogger(__name__)
 
-_VERBOSE_KEY = "verbose"
+# Click shares ``ctx.meta`` across the whole context chain, so the flag set by
+# the group callback is visible to every subcommand with a single dict read.
+_VERBOSE_KEY = "tasky.verbose"
+
+# Status presentation: list order and single-character indicators
+_STATUS_DISPLAY_ORDER: tuple[TaskStatus, ...] = (
+    TaskStatus.PENDING,
+    TaskStatus.COMPLETED,
+    TaskStatus.CANCELLED,
+)
+_STATUS_INDICATORS: dict[TaskStatus, str] = {
+    TaskStatus.PENDING: "○",
+    TaskStatus.COMPLETED: "✓",
+    TaskStatus.CANCELLED: "✗",
+}
+
+# Background registry updates (see _update_project_last_accessed)
+_LAST_ACCESSED_DEBOUNCE_SECONDS = 1.0
+_last_accessed_sent_at: dict[Path, float] = {}
+# At most one writer per project: the latest thread started for each root
+_registry_writers: dict[Path, threading.Thread] = {}
+
+# Handlers are stateless, so a single dispatcher is shared by every command
+_error_dispatcher = ErrorDispatcher()
 
 
 @task_app.callback()
@@ -47,8 +76,7 @@ def task_app_callback(
     ),
 ) -> None:
     """Configure task command context."""
-    ctx.ensure_object(dict)
-    ctx.obj[_VERBOSE_KEY] = verbose
+    ctx.meta[_VERBOSE_KEY] = verbose
 
 
 def with_task_error_handling(func: F) -> F:  # noqa: UP047
@@ -56,18 +84,15 @@ def with_task_error_handling(func: F) -> F:  # noqa: UP047
 
     @wraps(func)
     def wrapper(*args: object, **kwargs: object) -> object:
-        ctx = click.get_current_context(silent=True)
-        # Convert Click context to a generic dict-like object for _is_verbose
-        typer_ctx = _convert_context(ctx)
-        verbose = _is_verbose(typer_ctx)
-
         try:
             return func(*args, **kwargs)
         except typer.Exit:
             raise
         except Exception as exc:  # pragma: no cover - defensive catch-all
-            dispatcher = ErrorDispatcher()
-            result = dispatcher.dispatch(exc, verbose=verbose)
+            # Verbosity only matters for error output, so resolve it here and
+            # keep the successful path free of context lookups.
+            verbose = _is_verbose(click.get_current_context(silent=True))
+            result = _error_dispatcher.dispatch(exc, verbose=verbose)
             message = format_error_for_cli(result)
             typer.echo(message, err=True)
             raise typer.Exit(result.exit_code) from exc
@@ -75,6 +100,32 @@ def with_task_error_handling(func: F) -> F:  # noqa: UP047
     return cast("F", wrapper)
 
 
+_ONE_DAY = timedelta(days=1)
+
+# Length of "YYYY-MM-DD HH:MM:SS" (and the "T"-separated ISO form)
+_TIMESTAMP_WIDTH = 19
+
+# Validation results are pure functions of the raw CLI string, so repeated
+# arguments (scripted loops, in-process batches) skip re-validation.
+_VALIDATION_CACHE_SIZE = 64
+
+# Import errors listed before the remainder is summarized as a count
+_MAX_IMPORT_ERRORS_SHOWN = 5
+
+_VALID_IMPORT_STRATEGIES: frozenset[str] = frozenset({"append", "replace", "merge"})
+_VALID_IMPORT_STRATEGIES_MSG = "append, replace, merge"
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _cached_status(status: str) -> ValidationResult[TaskStatus]:
+    return status_validator.validate(status)
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _cached_date(date_str: str) -> ValidationResult[datetime]:
+    return date_validator.validate(date_str)
+
+
 def _parse_task_id_and_get_service(task_id: str) -> tuple[TaskService, UUID]:
     """Parse task ID and initialize task service.
 
@@ -95,16 +146,40 @@ def _parse_task_id_and_get_service(task_id: str) -> tuple[TaskService, UUID]:
         KeyError: If backend not registered (caught by error dispatcher)
 
     """
-    # Validate UUID format using TaskIdValidator
-    result = task_id_validator.validate(task_id)
-    if not result.is_valid:
-        typer.echo(result.error_message, err=True)
-        raise typer.Exit(1)
+    service, (parsed,) = _parse_task_ids_and_get_service([task_id])
+    return service, parsed
+
+
+def _parse_task_ids_and_get_service(task_ids: list[str]) -> tuple[TaskService, list[UUID]]:
+    """Parse several task IDs and initialize task service.
+
+    Every ID is parsed before the service is created, so one malformed
+    argument aborts the command before any task is touched. Repeated IDs
+    are dropped so each task is processed once.
 
-    # Only create service after UUID is validated
+    Args:
+        task_ids: The task ID strings from CLI input.
+
+    Returns:
+        Tuple of (TaskService instance, unique parsed UUIDs in argument order).
+
+    Raises:
+        typer.Exit: On invalid UUID format
+        ProjectNotFoundError: If no project found (caught by error dispatcher)
+        KeyError: If backend not registered (caught by error dispatcher)
+
+    """
+    # uuid.UUID parses (and rejects) every accepted form in a single call
+    try:
+        parsed = list(dict.fromkeys(UUID(task_id.strip()) for task_id in task_ids))
+    except ValueError:
+        typer.echo(INVALID_TASK_ID_MESSAGE, err=True)
+        raise typer.Exit(1) from None
+
+    # Only create service after all UUIDs are validated
     service = _get_service()
 
-    return service, result.value  # type: ignore[return-value]
+    return service, parsed
 
 
 def _validate_status_filter(status: str | None) -> TaskStatus | None:
@@ -123,7 +198,7 @@ def _validate_status_filter(status: str | None) -> TaskStatus | None:
     if status is None:
         return None
 
-    result = status_validator.validate(status)
+    result = _cached_status(status)
     if not result.is_valid:
         typer.echo(result.error_message, err=True)
         raise typer.Exit(1)
@@ -131,13 +206,11 @@ def _validate_status_filter(status: str | None) -> TaskStatus | None:
     return result.value  # type: ignore[return-value]
 
 
-def _parse_date_filter(date_str: str, *, inclusive_end: bool = False) -> datetime:
+def _parse_date_filter(date_str: str) -> datetime:
     """Parse and validate a date string for filtering.
 
     Args:
         date_str: Date string in ISO 8601 format (YYYY-MM-DD).
-        inclusive_end: If True, add 1 day to make the date inclusive of the entire day.
-                      Used for --created-before to include all of the specified date.
 
     Returns:
         A timezone-aware datetime object (UTC midnight).
@@ -147,20 +220,46 @@ def _parse_date_filter(date_str: str, *, inclusive_end: bool = False) -> datetim
 
     """
     # Validate date format using DateValidator
-    result = date_validator.validate(date_str)
+    result = _cached_date(date_str)
     if not result.is_valid:
         typer.echo(result.error_message, err=True)
         raise typer.Exit(1)
 
-    # For --created-before, add 1 day to make the exclusive < check
-    # inclusive of the entire day (user expects --created-before 2025-12-31
-    # to include all of Dec 31)
-    if inclusive_end:
-        return result.value + timedelta(days=1)  # type: ignore[operator, return-value]
-
     return result.value  # type: ignore[return-value]
 
 
+def _parse_end_date_filter(date_str: str) -> datetime:
+    """Parse an exclusive upper-bound date that still covers the whole given day.
+
+    For --created-before, one day is added so the exclusive < check includes
+    all of the specified date (user expects --created-before 2025-12-31 to
+    include all of Dec 31).
+
+    Args:
+        date_str: Date string in ISO 8601 format (YYYY-MM-DD).
+
+    Returns:
+        A timezone-aware datetime object (UTC midnight of the following day).
+
+    Raises:
+        typer.Exit: If the date format is invalid or cannot be parsed.
+
+    """
+    return _parse_date_filter(date_str) + _ONE_DAY
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format ``value`` as ``YYYY-MM-DD HH:MM:SS`` for human-readable output."""
+    # isoformat() is implemented in C and avoids strftime's format parsing;
+    # slicing drops fractional seconds and any UTC offset.
+    return value.isoformat(sep=" ", timespec="seconds")[:_TIMESTAMP_WIDTH]
+
+
+def _format_iso_timestamp(value: datetime) -> str:
+    """Format ``value`` as ``YYYY-MM-DDTHH:MM:SSZ`` for list output."""
+    return value.isoformat(timespec="seconds")[:_TIMESTAMP_WIDTH] + "Z"
+
+
 def _build_task_list_filter(
     task_status: TaskStatus | None,
     created_after_dt: datetime | None,
@@ -185,80 +284,73 @@ def _build_task_list_filter(
     # Normalize empty search to None (per spec: empty search = no filter)
     normalized_search = None if (search is None or not search.strip()) else search
 
-    has_filters = (
-        task_status is not None
-        or created_after_dt is not None
-        or created_before_dt is not None
-        or normalized_search is not None
-    )
+    # Only pass the criteria that are set so unset fields skip validation
+    candidates: dict[str, Any] = {
+        "statuses": [task_status] if task_status is not None else None,
+        "created_after": created_after_dt,
+        "created_before": created_before_dt,
+        "name_contains": normalized_search,
+    }
+    criteria = {name: value for name, value in candidates.items() if value is not None}
 
-    if has_filters:
-        return (
-            TaskFilter(
-                statuses=[task_status] if task_status is not None else None,
-                created_after=created_after_dt,
-                created_before=created_before_dt,
-                name_contains=normalized_search,
-            ),
-            True,
-        )
+    if criteria:
+        return TaskFilter(**criteria), True
 
     return None, False
 
 
-def _render_task_list_summary(tasks: list[TaskModel], *, has_filters: bool) -> None:
-    """Render the summary line after displaying tasks.
+def _format_task_list_summary(total: int, counts: dict[TaskStatus, int]) -> str:
+    """Build the summary line displayed after the task listing.
 
     Args:
-        tasks: List of tasks to summarize.
-        has_filters: Whether filters were applied to the task list.
+        total: Number of tasks displayed.
+        counts: Number of displayed tasks per status.
 
-    """
-    if not tasks:
-        # Show filter-specific message when filtering, generic message otherwise
-        if has_filters:
-            typer.echo("No matching tasks found")
-        else:
-            typer.echo("No tasks to display")
-        return
+    Returns:
+        Summary line with per-status counts.
 
-    # Count tasks by status
-    pending_count = sum(1 for t in tasks if t.status == TaskStatus.PENDING)
-    completed_count = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-    cancelled_count = sum(1 for t in tasks if t.status == TaskStatus.CANCELLED)
-
-    # Display summary line
-    task_word = "task" if len(tasks) == 1 else "tasks"
-    typer.echo(
-        f"\nShowing {len(tasks)} {task_word} "
-        f"({pending_count} pending, {completed_count} completed, "
-        f"{cancelled_count} cancelled)",
+    """
+    task_word = "task" if total == 1 else "tasks"
+    return (
+        f"Showing {total} {task_word} "
+        f"({counts[TaskStatus.PENDING]} pending, {counts[TaskStatus.COMPLETED]} completed, "
+        f"{counts[TaskStatus.CANCELLED]} cancelled)"
     )
 
 
 def _render_task_list(tasks: list[TaskModel], *, show_timestamps: bool = False) -> None:
-    """Render the list of tasks with status indicators.
+    """Render the list of tasks with status indicators, followed by the summary line.
 
     Args:
-        tasks: List of tasks to display (will be sorted by status).
+        tasks: Non-empty list of tasks to display (will be sorted by status).
         show_timestamps: Whether to show created_at and updated_at timestamps.
 
     """
-    # Sort tasks by status: pending → completed → cancelled
-    status_order = {TaskStatus.PENDING: 0, TaskStatus.COMPLETED: 1, TaskStatus.CANCELLED: 2}
-    sorted_tasks = sorted(tasks, key=lambda t: status_order[t.status])
-
-    # Display tasks with status indicators
+    # Order tasks by status: pending → completed → cancelled.
+    # Only three keys exist, so a stable bucket pass replaces a keyed sort.
+    buckets: dict[TaskStatus, list[TaskModel]] = {status: [] for status in _STATUS_DISPLAY_ORDER}
+    for task in tasks:
+        buckets[task.status].append(task)
+    sorted_tasks = [task for status in _STATUS_DISPLAY_ORDER for task in buckets[status]]
+
+    # Build all lines first so the listing and summary are emitted with a single write
+    lines: list[str] = []
     for task in sorted_tasks:
-        # Map status to indicator
-        status_indicator = _get_status_indicator(task.status)
-        typer.echo(f"{status_indicator} {task.task_id} {task.name} - {task.details}")
+        status_indicator = _STATUS_INDICATORS[task.status]
+        lines.append(f"{status_indicator} {task.task_id} {task.name} - {task.details}")
 
         # Show timestamps if requested
         if show_timestamps:
-            created = task.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-            updated = task.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-            typer.echo(f"  Created: {created} | Modified: {updated}")
+            created = _format_iso_timestamp(task.created_at)
+            updated = _format_iso_timestamp(task.updated_at)
+            lines.append(f"  Created: {created} | Modified: {updated}")
+
+    # The buckets already hold the per-status counts for the summary
+    counts = {status: len(bucket) for status, bucket in buckets.items()}
+    lines.append("")
+    lines.append(_format_task_list_summary(len(tasks), counts))
+
+    typer.echo("\n".join(lines))
 
 
 @task_app.command(name="list")
@@ -342,7 +434,7 @@ def list_command(
         created_after_dt = _parse_date_filter(created_after)
 
     if created_before is not None:
-        created_before_dt = _parse_date_filter(created_before, inclusive_end=True)
+        created_before_dt = _parse_end_date_filter(created_before)
 
     # Only create service after validating input
     service = _get_service()
@@ -359,33 +451,13 @@ def list_command(
 
     # Handle empty results early
     if not tasks:
-        _render_task_list_summary(tasks, has_filters=has_filters)
+        # Show filter-specific message when filtering, generic message otherwise
+        typer.echo("No matching tasks found" if has_filters else "No tasks to display")
         return
 
-    # Display tasks with status indicators
+    # Display tasks with status indicators and the summary line
     _render_task_list(tasks, show_timestamps=long)
 
-    # Display summary line
-    _render_task_list_summary(tasks, has_filters=has_filters)
-
-
-def _get_status_indicator(status: TaskStatus) -> str:
-    """Get the visual indicator for a task status.
-
-    Args:
-        status: The task status.
-
-    Returns:
-        A single-character indicator (○, ✓, or ✗).
-
-    """
-    indicators = {
-        TaskStatus.PENDING: "○",
-        TaskStatus.COMPLETED: "✓",
-        TaskStatus.CANCELLED: "✗",
-    }
-    return indicators[status]
-
 
 def _validate_and_apply_update_fields(
     task: object,
@@ -443,13 +515,16 @@ def show_command(task_id: str = typer.Argument(..., help="Task ID (UUID format)"
     task = service.get_task(uuid)
 
     # Display task details in human-readable format
-    typer.echo("Task Details")
-    typer.echo(f"ID: {task.task_id}")
-    typer.echo(f"Name: {task.name}")
-    typer.echo(f"Details: {task.details}")
-    typer.echo(f"Status: {task.status.value.upper()}")
-    typer.echo(f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    typer.echo(f"Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = (
+        "Task Details",
+        f"ID: {task.task_id}",
+        f"Name: {task.name}",
+        f"Details: {task.details}",
+        f"Status: {task.status.value.upper()}",
+        f"Created: {_format_timestamp(task.created_at)}",
+        f"Updated: {_format_timestamp(task.updated_at)}",
+    )
+    typer.echo("\n".join(lines))
 
 
 @task_app.command(name="create")
@@ -469,12 +544,15 @@ def create_command(
     task = service.create_task(name, details)
 
     # Display success message and task details
-    typer.echo("Task created successfully!")
-    typer.echo(f"ID: {task.task_id}")
-    typer.echo(f"Name: {task.name}")
-    typer.echo(f"Details: {task.details}")
-    typer.echo(f"Status: {task.status.value.upper()}")
-    typer.echo(f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = (
+        "Task created successfully!",
+        f"ID: {task.task_id}",
+        f"Name: {task.name}",
+        f"Details: {task.details}",
+        f"Status: {task.status.value.upper()}",
+        f"Created: {_format_timestamp(task.created_at)}",
+    )
+    typer.echo("\n".join(lines))
 
     # Update project last accessed timestamp
     _update_project_last_accessed()
@@ -528,12 +606,15 @@ def update_command(
     service.update_task(task)
 
     # Display updated task details
-    typer.echo("Task updated successfully!")
-    typer.echo(f"ID: {task.task_id}")
-    typer.echo(f"Name: {task.name}")
-    typer.echo(f"Details: {task.details}")
-    typer.echo(f"Status: {task.status.value.upper()}")
-    typer.echo(f"Modified: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = (
+        "Task updated successfully!",
+        f"ID: {task.task_id}",
+        f"Name: {task.name}",
+        f"Details: {task.details}",
+        f"Status: {task.status.value.upper()}",
+        f"Modified: {_format_timestamp(task.updated_at)}",
+    )
+    typer.echo("\n".join(lines))
 
     # Update project last accessed timestamp
     _update_project_last_accessed()
@@ -542,6 +623,10 @@ def update_command(
 def _get_service() -> TaskService:
     """Get or create a task service for the current project.
 
+    The service is memoized per project root, so repeated calls within one
+    process (follow-up registry updates, tests, batch usage) do not rebuild
+    settings and storage.
+
     Returns:
         Configured TaskService instance
 
@@ -550,18 +635,83 @@ def _get_service() -> TaskService:
         KeyError: If configured backend is not registered
 
     """
-    return create_task_service()
+    return _service_for_project(_current_project_root())
+
+
+@lru_cache(maxsize=1)
+def _service_for_project(project_root: Path) -> TaskService:
+    return create_task_service(project_root)
+
+
+def _current_project_root() -> Path:
+    """Return the project root for the current working directory.
+
+    Only successful lookups are memoized, and a cached root is re-checked on
+    every hit: if its ``.tasky`` directory was removed outside this process,
+    the caches are dropped and the lookup runs again.
+    """
+    cwd = Path.cwd()
+    project_root = _project_root_for(cwd)
+    if not (project_root / ".tasky").is_dir():
+        reset_service_cache()
+        project_root = _project_root_for(cwd)
+    return project_root
+
+
+@lru_cache(maxsize=1)
+def _project_root_for(cwd: Path) -> Path:
+    return find_project_root(cwd)
+
+
+def reset_service_cache() -> None:
+    """Forget the memoized project root and task service.
+
+    Call this when a project's configuration changes within one process (for
+    example after ``tasky project init``) so the next task command rebuilds
+    its service from the new settings.
+    """
+    _service_for_project.cache_clear()
+    _project_root_for.cache_clear()
 
 
 def _update_project_last_accessed() -> None:
     """Update the last accessed timestamp for the current project in the registry.
 
     This is called after any task operation to keep the registry's
-    last_accessed timestamp current.
+    last_accessed timestamp current. The registry write runs on a daemon
+    thread so it does not delay command output, and is joined at exit so it
+    is never lost; repeated calls for the same project within
+    ``_LAST_ACCESSED_DEBOUNCE_SECONDS``, or while a previous write for it is
+    still running, are coalesced into that write.
 
     """
     try:
-        project_root = find_project_root()
+        project_root = _current_project_root()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to update project last_accessed timestamp: %s", exc)
+        return
+
+    now = time.monotonic()
+    last_sent = _last_accessed_sent_at.get(project_root)
+    if last_sent is not None and now - last_sent < _LAST_ACCESSED_DEBOUNCE_SECONDS:
+        return
+    in_flight = _registry_writers.get(project_root)
+    if in_flight is not None and in_flight.is_alive():
+        return
+    _last_accessed_sent_at[project_root] = now
+
+    thread = threading.Thread(
+        target=_write_project_last_accessed,
+        args=(project_root,),
+        daemon=True,
+    )
+    thread.start()
+    _registry_writers[project_root] = thread
+
+
+def _write_project_last_accessed(project_root: Path) -> None:
+    """Persist the last accessed timestamp for ``project_root``."""
+    try:
         registry_service = get_project_registry_service()
         registry_service.update_last_accessed(project_root)
     except Exception as exc:  # noqa: BLE001
@@ -570,96 +720,126 @@ def _update_project_last_accessed() -> None:
         logger.debug("Failed to update project last_accessed timestamp: %s", exc)
 
 
-def _convert_context(ctx: click.Context | None) -> typer.Context | None:
-    """Convert a Click context to a Typer context."""
-    if ctx is None:
-        return None
-    # Typer.Context is a subclass of click.Context, so we can cast safely
-    return ctx  # type: ignore[return-value]
+def _join_pending_registry_updates() -> None:
+    """Wait for in-flight registry writes so no update is lost at exit."""
+    while _registry_writers:
+        _, thread = _registry_writers.popitem()
+        thread.join()
 
 
-def _is_verbose(ctx: typer.Context | None) -> bool:
-    current = ctx
-    while current is not None:
-        obj: object = current.obj
-        if isinstance(obj, dict):
-            value: bool = bool(obj.get(_VERBOSE_KEY, False))
-            return value
-        current = current.parent
-    return False
+atexit.register(_join_pending_registry_updates)
+
+
+def _is_verbose(ctx: click.Context | None) -> bool:
+    if ctx is None:
+        return False
+    return bool(ctx.meta.get(_VERBOSE_KEY, False))
 
 
 @task_app.command(name="complete")
 @with_task_error_handling
-def complete_command(task_id: str) -> None:
-    """Mark a task as completed.
+def complete_command(
+    task_ids: list[str] = typer.Argument(..., help="Task ID(s) (UUID format)"),  # noqa: B008
+) -> None:
+    """Mark one or more tasks as completed.
+
+    Tasks are processed in argument order and processing stops at the first
+    error, so tasks listed before a failing ID stay completed.
 
     Args:
-        task_id: The UUID of the task to complete.
+        task_ids: The UUIDs of the tasks to complete.
 
     """
-    service, uuid = _parse_task_id_and_get_service(task_id)
-    task = service.complete_task(uuid)
-    typer.echo(f"✓ Task completed: {task.name}")
-    typer.echo(f"  Completed at: {task.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-    # Update project last accessed timestamp
-    _update_project_last_accessed()
+    service, uuids = _parse_task_ids_and_get_service(task_ids)
+    try:
+        for uuid in uuids:
+            task = service.complete_task(uuid)
+            completed_at = _format_timestamp(task.updated_at)
+            typer.echo(f"✓ Task completed: {task.name}\n  Completed at: {completed_at}")
+    finally:
+        # Earlier tasks may have changed even if a later ID failed
+        _update_project_last_accessed()
 
 
 @task_app.command(name="cancel")
 @with_task_error_handling
-def cancel_command(task_id: str) -> None:
-    """Mark a task as cancelled.
+def cancel_command(
+    task_ids: list[str] = typer.Argument(..., help="Task ID(s) (UUID format)"),  # noqa: B008
+) -> None:
+    """Mark one or more tasks as cancelled.
+
+    Tasks are processed in argument order and processing stops at the first
+    error.
 
     Args:
-        task_id: The UUID of the task to cancel.
+        task_ids: The UUIDs of the tasks to cancel.
 
     """
-    service, uuid = _parse_task_id_and_get_service(task_id)
-    task = service.cancel_task(uuid)
-    typer.echo(f"✗ Task cancelled: {task.name}")
-
-    # Update project last accessed timestamp
-    _update_project_last_accessed()
+    service, uuids = _parse_task_ids_and_get_service(task_ids)
+    try:
+        for uuid in uuids:
+            task = service.cancel_task(uuid)
+            typer.echo(f"✗ Task cancelled: {task.name}")
+    finally:
+        # Earlier tasks may have changed even if a later ID failed
+        _update_project_last_accessed()
 
 
 @task_app.command(name="reopen")
 @with_task_error_handling
-def reopen_command(task_id: str) -> None:
-    """Reopen a completed or cancelled task.
+def reopen_command(
+    task_ids: list[str] = typer.Argument(..., help="Task ID(s) (UUID format)"),  # noqa: B008
+) -> None:
+    """Reopen one or more completed or cancelled tasks.
+
+    Tasks are processed in argument order and processing stops at the first
+    error.
 
     Args:
-        task_id: The UUID of the task to reopen.
+        task_ids: The UUIDs of the tasks to reopen.
 
     """
-    service, uuid = _parse_task_id_and_get_service(task_id)
-    task = service.reopen_task(uuid)
-    typer.echo(f"↻ Task reopened: {task.name}")
-
-    # Update project last accessed timestamp
-    _update_project_last_accessed()
+    service, uuids = _parse_task_ids_and_get_service(task_ids)
+    try:
+        for uuid in uuids:
+            task = service.reopen_task(uuid)
+            typer.echo(f"↻ Task reopened: {task.name}")
+    finally:
+        # Earlier tasks may have changed even if a later ID failed
+        _update_project_last_accessed()
 
 
 @task_app.command(name="export")
 @with_task_error_handling
 def export_command(
     file_path: str = typer.Argument(..., help="Path to export JSON file"),
+    compact: bool = typer.Option(  # noqa: FBT001
+        False,  # noqa: FBT003
+        "--compact",
+        help="Write JSON without indentation: smaller and faster, but not human-friendly",
+    ),
 ) -> None:
     """Export tasks to a JSON file.
 
     Exports all tasks to a JSON backup file. The file can be imported later
-    using the 'task import' command.
+    using the 'task import' command. Use --compact for large backups that do
+    not need to be read by people.
 
     Examples:
         tasky task export backup.json
+        tasky task export backup.json --compact
 
     """
+    # Reject obviously invalid targets before paying for service initialization
+    export_path = Path(file_path)
+    if not file_path or export_path.is_dir():
+        typer.echo(f"✗ Invalid export path: {file_path}", err=True)
+        raise typer.Exit(1)
+
     service = _get_service()
     export_service = TaskImportExportService(service)
 
-    export_path = Path(file_path)
-    export_doc = export_service.export_tasks(export_path)
+    export_doc = export_service.export_tasks(export_path, compact=compact)
 
     typer.echo(f"✓ Exported {export_doc.task_count} tasks to: {file_path}")
 
@@ -698,10 +878,18 @@ def import_command(
     # Validate and normalize strategy (case-insensitive)
     strategy = _validate_import_strategy(strategy)
 
+    # Fail fast on a missing file before paying for service initialization
+    import_path = Path(file_path)
+    if not import_path.exists():
+        typer.echo(f"✗ File not found: {file_path}", err=True)
+        raise typer.Exit(1)
+    if not import_path.is_file():
+        typer.echo(f"✗ Not a file: {file_path}", err=True)
+        raise typer.Exit(1)
+
     service = _get_service()
     export_service = TaskImportExportService(service)
 
-    import_path = Path(file_path)
     result = export_service.import_tasks(import_path, strategy=strategy, dry_run=dry_run)
 
     # Show results
@@ -710,41 +898,46 @@ def import_command(
 
 def _validate_import_strategy(strategy: str) -> str:
     """Validate import strategy (case-insensitive) and return normalized value."""
-    valid_strategies = ["append", "replace", "merge"]
     normalized = strategy.lower()
-    if normalized not in valid_strategies:
-        typer.echo(f"✗ Invalid strategy: {strategy}", err=True)
-        typer.echo(f"  Valid strategies: {', '.join(valid_strategies)}", err=True)
+    if normalized not in _VALID_IMPORT_STRATEGIES:
+        typer.echo(
+            f"✗ Invalid strategy: {strategy}\n  Valid strategies: {_VALID_IMPORT_STRATEGIES_MSG}",
+            err=True,
+        )
         raise typer.Exit(1)
     return normalized
 
 
 def _display_import_results(result: ImportResult, *, dry_run: bool) -> None:
     """Display import results with statistics."""
-    max_errors_shown = 5
-
     # Format output per spec requirements
-    if dry_run:
-        typer.echo(f"[DRY RUN] Would import: {result.created} created, {result.updated} updated")
-    else:
-        typer.echo(f"✓ Import complete: {result.created} created, {result.updated} updated")
+    prefix = "[DRY RUN] Would import" if dry_run else "✓ Import complete"
+    lines = [f"{prefix}: {result.created} created, {result.updated} updated"]
 
     # Show skipped count if there were errors
     if result.skipped > 0:
-        typer.echo(f"  Skipped: {result.skipped} (errors)")
+        lines.append(f"  Skipped: {result.skipped} (errors)")
 
-    _show_import_errors(result.errors, max_shown=max_errors_shown)
+    typer.echo("\n".join(lines))
 
+    _show_import_errors(result.errors, total=result.skipped, max_shown=_MAX_IMPORT_ERRORS_SHOWN)
 
-def _show_import_errors(errors: list[str], *, max_shown: int) -> None:
-    """Display import errors with truncation."""
+
+def _show_import_errors(errors: list[str], *, total: int, max_shown: int) -> None:
+    """Display import errors with truncation.
+
+    ``errors`` may itself be truncated by the import service, so the number
+    of hidden errors is derived from ``total`` rather than ``len(errors)``.
+    """
     if not errors:
         return
 
-    typer.echo("\n⚠ Errors encountered:", err=True)
-    for error in errors[:max_shown]:
-        typer.echo(f"  - {error}", err=True)
+    shown = errors[:max_shown]
+    lines = ["\n⚠ Errors encountered:"]
+    lines.extend(f"  - {error}" for error in shown)
+
+    remaining = total - len(shown)
+    if remaining > 0:
+        lines.append(f"  ... and {remaining} more errors")
 
-    if len(errors) > max_shown:
-        remaining = len(errors) - max_shown
-        typer.echo(f"  ... and {remaining} more errors", err=True)
+    typer.echo("\n".join(lines), err=True)
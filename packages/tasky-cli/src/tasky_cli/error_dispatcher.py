@@ -24,6 +24,24 @@ from tasky_tasks.enums import TaskStatus
 
 ExcT_contra = TypeVar("ExcT_contra", bound=Exception, contravariant=True)
 
+_REOPEN_SUGGESTION = "Use 'tasky task reopen {task_id}' to make it pending first."
+_COMPLETED_SUGGESTION = (
+    "Task is already completed. Use 'tasky task reopen {task_id}' if you want to make changes."
+)
+_CANCELLED_SUGGESTION = (
+    "Task is already cancelled. Use 'tasky task reopen {task_id}' if you want to make changes."
+)
+_FALLBACK_SUGGESTION = "Use 'tasky task list' to inspect the current status of task '{task_id}'."
+
+# Suggestion templates for invalid transitions, formatted with the task ID on use
+_TRANSITION_SUGGESTIONS: dict[tuple[TaskStatus | None, TaskStatus | None], str] = {
+    (TaskStatus.CANCELLED, TaskStatus.COMPLETED): _REOPEN_SUGGESTION,
+    (TaskStatus.COMPLETED, TaskStatus.CANCELLED): _REOPEN_SUGGESTION,
+    (TaskStatus.COMPLETED, TaskStatus.COMPLETED): _COMPLETED_SUGGESTION,
+    (TaskStatus.CANCELLED, TaskStatus.CANCELLED): _CANCELLED_SUGGESTION,
+    (TaskStatus.PENDING, TaskStatus.PENDING): "Task is already pending. No action needed.",
+}
+
 
 class ErrorHandler(Protocol[ExcT_contra]):
     """Protocol for exception handler functions.
@@ -37,28 +55,45 @@ class ErrorHandler(Protocol[ExcT_contra]):
         ...
 
 
-HandlerEntry = tuple[type[Exception], ErrorHandler[Exception]]
-
-
 class ErrorDispatcher:
-    """Registry-based error dispatcher for CLI exceptions."""
+    """Registry-based error dispatcher for CLI exceptions.
+
+    Handlers are keyed by exception type and resolved by walking the raised
+    exception's MRO, so the most specific registered class wins and lookup
+    cost does not grow with the number of registered handlers.
+    """
 
     def __init__(self) -> None:
-        self._registry: list[HandlerEntry] = []
-        self._fallback: HandlerEntry = (
-            Exception,
-            self._handle_unexpected_error,
-        )
+        self._registry: dict[type[Exception], ErrorHandler[Exception]] = {}
+        self._fallback: ErrorHandler[Exception] = self._handle_unexpected_error
         self._register_default_handlers()
 
     def register(
         self,
         exc_type: type[ExcT_contra],
         handler: ErrorHandler[ExcT_contra],
+        *,
+        replace: bool = False,
     ) -> None:
-        """Register a handler for a specific exception type."""
-        entry: HandlerEntry = (exc_type, cast("ErrorHandler[Exception]", handler))
-        self._registry.append(entry)
+        """Register a handler for a specific exception type.
+
+        Registering the same (type, handler) pair again is a no-op so a shared
+        dispatcher never accumulates entries. Pass ``replace=True`` to swap the
+        handler already registered for a type, such as a default handler.
+
+        Raises:
+            ValueError: If a different handler is already registered for the
+                type and ``replace`` is False.
+
+        """
+        existing = self._registry.get(exc_type)
+        if existing is not None and existing != handler and not replace:
+            msg = (
+                f"A different handler is already registered for {exc_type.__name__}; "
+                "pass replace=True to override it"
+            )
+            raise ValueError(msg)
+        self._registry[exc_type] = cast("ErrorHandler[Exception]", handler)
 
     def dispatch(self, exc: Exception, *, verbose: bool) -> ErrorResult:
         """Route exception to the first matching handler and return structured result.
@@ -76,7 +111,7 @@ class ErrorDispatcher:
     # ========== Registry Helpers ==========
 
     def _register_default_handlers(self) -> None:
-        """Register built-in handlers in priority order (specific → general)."""
+        """Register built-in handlers for domain, storage and settings errors."""
         self.register(TaskNotFoundError, self._handle_task_not_found)
         self.register(TaskValidationError, self._handle_task_validation_error)
         self.register(InvalidStateTransitionError, self._handle_invalid_transition)
@@ -92,12 +127,15 @@ class ErrorDispatcher:
         self.register(PydanticValidationError, self._handle_pydantic_validation_error)
 
     def _resolve_handler(self, exc: Exception) -> ErrorHandler[Exception]:
-        """Return the first registered handler that matches the exception."""
-        for exc_type, handler in self._registry:
-            if isinstance(exc, exc_type):
+        """Return the handler registered for the closest class in the exception's MRO.
+
+        The fallback is returned only when no class in the MRO has a handler.
+        """
+        for exc_type in type(exc).__mro__:
+            handler = self._registry.get(exc_type)
+            if handler is not None:
                 return handler
-        _, handler = self._fallback
-        return handler
+        return self._fallback
 
     # ========== Task Domain Error Handlers ==========
 
@@ -116,7 +154,7 @@ class ErrorDispatcher:
         verbose: bool,
     ) -> ErrorResult:
         suggestion = None
-        if getattr(exc, "field", None):
+        if exc.field:
             suggestion = f"Check the value provided for '{exc.field}'."
         return self._format_error(
             str(exc) or "Task validation failed.",
@@ -131,11 +169,12 @@ class ErrorDispatcher:
         *,
         verbose: bool,
     ) -> ErrorResult:
-        from_label = getattr(exc.from_status, "value", str(exc.from_status))
-        to_label = getattr(exc.to_status, "value", str(exc.to_status))
+        from_status, to_status = exc.from_status, exc.to_status
+        from_label = from_status.value if isinstance(from_status, TaskStatus) else str(from_status)
+        to_label = to_status.value if isinstance(to_status, TaskStatus) else str(to_status)
         suggestion = self._suggest_transition(
-            from_status=exc.from_status,
-            to_status=exc.to_status,
+            from_status=from_status,
+            to_status=to_status,
             task_id=str(exc.task_id),
         )
         return self._format_error(
@@ -242,12 +281,14 @@ class ErrorDispatcher:
         *,
         verbose: bool,
     ) -> ErrorResult:
-        errors = exc.errors()
+        # Only the location and message are rendered, so skip building the rest
+        errors = exc.errors(include_url=False, include_context=False, include_input=False)
         if errors:
             first_error = errors[0]
             field = first_error.get("loc", ("unknown",))[-1]
-            message = first_error.get("msg", "Validation failed").capitalize()
-            rendered = f"{message} for field '{field}'."
+            message = first_error.get("msg", "Validation failed")
+            # Upper-case the first letter only; capitalize() would lowercase names like UUID
+            rendered = f"{message[:1].upper()}{message[1:]} for field '{field}'."
         else:
             rendered = "Validation failed."
         return self._format_error(
@@ -289,29 +330,8 @@ class ErrorDispatcher:
         except ValueError:
             to_enum = None
 
-        reopen_suggestion = f"Use 'tasky task reopen {task_id}' to make it pending first."
-        completed_suggestion = (
-            "Task is already completed. "
-            f"Use 'tasky task reopen {task_id}' if you want to make changes."
-        )
-        cancelled_suggestion = (
-            "Task is already cancelled. "
-            f"Use 'tasky task reopen {task_id}' if you want to make changes."
-        )
-        suggestions = {
-            (TaskStatus.CANCELLED, TaskStatus.COMPLETED): reopen_suggestion,
-            (TaskStatus.COMPLETED, TaskStatus.CANCELLED): reopen_suggestion,
-            (TaskStatus.COMPLETED, TaskStatus.COMPLETED): completed_suggestion,
-            (TaskStatus.CANCELLED, TaskStatus.CANCELLED): cancelled_suggestion,
-            (TaskStatus.PENDING, TaskStatus.PENDING): "Task is already pending. No action needed.",
-        }
-        if (
-            from_enum is not None
-            and to_enum is not None
-            and (suggestion := suggestions.get((from_enum, to_enum)))
-        ):
-            return suggestion
-        return f"Use 'tasky task list' to inspect the current status of task '{task_id}'."
+        template = _TRANSITION_SUGGESTIONS.get((from_enum, to_enum), _FALLBACK_SUGGESTION)
+        return template.format(task_id=task_id)
 
     def _format_error(
         self,
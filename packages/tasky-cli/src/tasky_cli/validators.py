@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Protocol
@@ -11,9 +12,12 @@ from pydantic import BaseModel, ValidationError, field_validator
 from tasky_tasks.enums import TaskStatus
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult[T]:
-    """Result of input validation, containing either a value or error message."""
+    """Result of input validation, containing either a value or error message.
+
+    Immutable, because cached validators hand the same instance to every caller.
+    """
 
     is_valid: bool
     value: T | None = None
@@ -51,6 +55,11 @@ class _TaskIdPayload(BaseModel):
         return normalized
 
 
+# ``date.fromisoformat`` also accepts compact (20251231) and week (2025-W01-1)
+# forms, so the accepted shape is pinned before the calendar check runs.
+_ISO_DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
 class _DatePayload(BaseModel):
     date: datetime
 
@@ -59,10 +68,7 @@ class _DatePayload(BaseModel):
     def _parse_iso_date(cls, raw_value: str) -> datetime:
         message = "Invalid date format: use YYYY-MM-DD (e.g., 2025-12-31)"
         normalized = raw_value.strip()
-        if not normalized:
-            raise ValueError(message)
-
-        if any(marker in normalized for marker in ("T", ":", "+", "Z")):
+        if _ISO_DATE_PATTERN.fullmatch(normalized) is None:
             raise ValueError(message)
 
         try:
@@ -91,10 +97,13 @@ class _StatusPayload(BaseModel):
         return normalized
 
 
+INVALID_TASK_ID_MESSAGE = "Invalid task ID: must be a valid UUID"
+
+
 class TaskIdValidator(Validator[UUID]):
     """Validator for task ID inputs (UUID format)."""
 
-    _ERROR_MESSAGE = "Invalid task ID: must be a valid UUID"
+    _ERROR_MESSAGE = INVALID_TASK_ID_MESSAGE
 
     def validate(self, task_id: str) -> ValidationResult[UUID]:
         """Validate that ``task_id`` is a UUID."""
@@ -122,14 +131,14 @@ class DateValidator(Validator[datetime]):
 class StatusValidator(Validator[TaskStatus]):
     """Validator for task status inputs."""
 
+    _ERROR_MESSAGE = f"Invalid status. Choose from: {', '.join(s.value for s in TaskStatus)}"
+
     def validate(self, status: str) -> ValidationResult[TaskStatus]:
         """Validate CLI status input."""
-        valid_statuses = ", ".join(s.value for s in TaskStatus)
-        error_message = f"Invalid status. Choose from: {valid_statuses}"
         try:
             payload = _StatusPayload.model_validate({"status": status})
         except ValidationError:
-            return ValidationResult[TaskStatus].failure(error_message)
+            return ValidationResult[TaskStatus].failure(self._ERROR_MESSAGE)
         return ValidationResult[TaskStatus].success(payload.status)
 
 
@@ -138,6 +147,7 @@ date_validator = DateValidator()
 status_validator = StatusValidator()
 
 __all__ = [
+    "INVALID_TASK_ID_MESSAGE",
     "DateValidator",
     "StatusValidator",
     "TaskIdValidator",
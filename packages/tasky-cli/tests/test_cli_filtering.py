@@ -179,6 +179,34 @@ class TestTaskFilteringCLI:
         assert "Pending Task 1" in result_upper.stdout
         assert "Pending Task 1" in result_mixed.stdout
 
+    def test_repeated_status_filter_gives_same_result(
+        self,
+        runner: CliRunner,
+        project_with_tasks: Path,  # noqa: ARG002
+    ) -> None:
+        """Test that repeating the same status argument filters the same way each time."""
+        first = runner.invoke(task_app, ["list", "--status", "pending"])
+        second = runner.invoke(task_app, ["list", "--status", "pending"])
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert "Pending Task 1" in second.stdout
+        assert second.stdout == first.stdout
+
+    def test_repeated_invalid_status_reports_same_error(
+        self,
+        runner: CliRunner,
+        project_with_tasks: Path,  # noqa: ARG002
+    ) -> None:
+        """Test that an invalid status is rejected the same way on every call."""
+        first = runner.invoke(task_app, ["list", "--status", "bogus"])
+        second = runner.invoke(task_app, ["list", "--status", "bogus"])
+
+        assert first.exit_code == 1
+        assert second.exit_code == 1
+        assert "Invalid status" in second.stderr
+        assert second.stderr == first.stderr
+
     def test_filter_empty_results(
         self,
         runner: CliRunner,
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 import typer
@@ -184,6 +184,21 @@ class TestErrorDispatcher:
         assert result.suggestion is not None
         assert "Check your input values" in result.suggestion
 
+    def test_pydantic_validation_error_keeps_message_case(
+        self,
+        dispatcher: ErrorDispatcher,
+    ) -> None:
+        class SampleModel(BaseModel):
+            task_id: UUID
+
+        with pytest.raises(ValidationError) as exc_info:
+            SampleModel(task_id="not-a-uuid")  # type: ignore[arg-type]
+
+        result = dispatcher.dispatch(exc_info.value, verbose=False)
+
+        assert result.message.startswith("Input should be a valid UUID")
+        assert "for field 'task_id'" in result.message
+
     def test_pydantic_validation_error_with_empty_errors(self, dispatcher: ErrorDispatcher) -> None:
         class SampleModel(BaseModel):
             name: str
@@ -193,7 +208,7 @@ class TestErrorDispatcher:
 
         validation_error = exc_info.value
 
-        def mock_errors() -> list[dict[str, object]]:
+        def mock_errors(**_kwargs: object) -> list[dict[str, object]]:
             return []
 
         validation_error.errors = mock_errors  # type: ignore[method-assign]
@@ -250,3 +265,66 @@ class TestErrorDispatcher:
         assert result.exit_code == 7
         assert "custom handled (" in result.message
         assert result.suggestion == "verbose"
+
+    def test_duplicate_registration_is_ignored(
+        self,
+        dispatcher: ErrorDispatcher,
+    ) -> None:
+        def handler(exc: RuntimeError, *, verbose: bool) -> ErrorResult:  # noqa: ARG001
+            return ErrorResult(message="handled", suggestion=None, exit_code=4)
+
+        dispatcher.register(RuntimeError, handler)
+        dispatcher.register(RuntimeError, handler)
+
+        result = dispatcher.dispatch(RuntimeError(), verbose=False)
+
+        assert result.message == "handled"
+        assert result.exit_code == 4
+
+    def test_conflicting_registration_raises(
+        self,
+        dispatcher: ErrorDispatcher,
+    ) -> None:
+        def first(exc: RuntimeError, *, verbose: bool) -> ErrorResult:  # noqa: ARG001
+            return ErrorResult(message="first", suggestion=None, exit_code=4)
+
+        def second(exc: RuntimeError, *, verbose: bool) -> ErrorResult:  # pragma: no cover
+            return ErrorResult(message=str(exc), suggestion=str(verbose), exit_code=5)
+
+        dispatcher.register(RuntimeError, first)
+
+        with pytest.raises(ValueError, match="RuntimeError"):
+            dispatcher.register(RuntimeError, second)
+
+        assert dispatcher.dispatch(RuntimeError(), verbose=False).message == "first"
+
+    def test_replace_overrides_default_handler(
+        self,
+        dispatcher: ErrorDispatcher,
+    ) -> None:
+        def handler(exc: TaskNotFoundError, *, verbose: bool) -> ErrorResult:  # noqa: ARG001
+            return ErrorResult(message="custom not found", suggestion=None, exit_code=9)
+
+        dispatcher.register(TaskNotFoundError, handler, replace=True)
+
+        result = dispatcher.dispatch(TaskNotFoundError(task_id=uuid4()), verbose=False)
+
+        assert result.message == "custom not found"
+        assert result.exit_code == 9
+
+    def test_subclass_handler_registered_later_takes_precedence(
+        self,
+        dispatcher: ErrorDispatcher,
+    ) -> None:
+        class CustomDomainError(TaskDomainError):
+            pass
+
+        def handler(exc: CustomDomainError, *, verbose: bool) -> ErrorResult:  # noqa: ARG001
+            return ErrorResult(message=f"custom: {exc}", suggestion=None, exit_code=6)
+
+        dispatcher.register(CustomDomainError, handler)
+
+        result = dispatcher.dispatch(CustomDomainError("boom"), verbose=False)
+
+        assert result.message == "custom: boom"
+        assert result.exit_code == 6
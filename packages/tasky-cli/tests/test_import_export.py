@@ -7,8 +7,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+from tasky_cli.commands import tasks as tasks_module
 from tasky_cli.commands.tasks import task_app
 from tasky_settings import create_task_service
+from tasky_tasks import ImportResult
 from typer.testing import CliRunner
 
 if TYPE_CHECKING:
@@ -50,6 +52,26 @@ class TestExportCommand:
         assert "tasks" in data
         assert len(data["tasks"]) == len(sample_tasks)
 
+    def test_export_compact_writes_single_line_reimportable_file(
+        self,
+        runner: CliRunner,
+        sample_tasks: list[TaskModel],
+        tmp_path: Path,
+    ) -> None:
+        """Test that --compact writes unindented JSON that imports like the default."""
+        export_file = tmp_path / "export.json"
+
+        result = runner.invoke(task_app, ["export", str(export_file), "--compact"])
+
+        assert result.exit_code == 0
+        content = export_file.read_text(encoding="utf-8")
+        assert "\n" not in content
+        assert len(json.loads(content)["tasks"]) == len(sample_tasks)
+
+        import_result = runner.invoke(task_app, ["import", str(export_file), "--dry-run"])
+        assert import_result.exit_code == 0
+        assert f"{len(sample_tasks)} created" in import_result.stdout
+
     def test_export_creates_valid_reimportable_file(
         self,
         runner: CliRunner,
@@ -140,10 +162,53 @@ class TestExportCommand:
         assert "Task with 'quotes' & symbols" in task_names
         assert "Unicode Task" in task_names
 
+    def test_export_to_directory_fails_before_service_init(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that exporting to a directory is rejected without touching the project."""
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(task_app, ["export", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Invalid export path" in result.stderr
+
 
 class TestImportCommand:
     """Test suite for import command."""
 
+    def test_import_missing_file_fails_before_service_init(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a missing import file is reported without requiring a project."""
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(task_app, ["import", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stderr
+
+    def test_import_directory_reports_not_a_file(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a directory argument is reported as not a file."""
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(task_app, ["import", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Not a file" in result.stderr
+        assert "File not found" not in result.stderr
+
     def test_import_from_empty_file_fails(
         self,
         runner: CliRunner,
@@ -354,3 +419,33 @@ class TestImportExportIntegration:
 
         assert result.exit_code == 1
         assert "Invalid strategy" in result.stderr
+        assert "Valid strategies: append, replace, merge" in result.stderr
+
+
+class TestImportResultsDisplay:
+    """Test suite for import result output."""
+
+    def test_errors_beyond_limit_are_summarized(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that only the first import errors are listed, followed by a count."""
+        errors = [f"Failed to import task '{index}'" for index in range(8)]
+        result = ImportResult(total_processed=10, created=2, skipped=8, errors=errors)
+
+        tasks_module._display_import_results(result, dry_run=False)  # noqa: SLF001
+
+        captured = capsys.readouterr()
+        assert captured.out == "✓ Import complete: 2 created, 0 updated\n  Skipped: 8 (errors)\n"
+        assert "  - Failed to import task '4'" in captured.err
+        assert "Failed to import task '5'" not in captured.err
+        assert captured.err.endswith("  ... and 3 more errors\n")
+
+    def test_hidden_error_count_uses_total_skipped(
+        self,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that errors dropped by the import service are still counted."""
+        errors = [f"Failed to import task '{index}'" for index in range(6)]
+        result = ImportResult(total_processed=40, created=0, skipped=40, errors=errors)
+
+        tasks_module._display_import_results(result, dry_run=False)  # noqa: SLF001
+
+        assert capsys.readouterr().err.endswith("  ... and 35 more errors\n")
@@ -0,0 +1,82 @@
+"""Tests for background project registry updates after task commands."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from tasky_cli.commands import tasks as tasks_module
+from tasky_cli.commands.tasks import task_app
+from tasky_projects.registry import ProjectRegistryService
+from typer.testing import CliRunner
+
+
+class TestProjectLastAccessedUpdates:
+    """Test suite for last_accessed registry writes triggered by task commands."""
+
+    def test_rapid_commands_debounce_registry_updates(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that rapid task commands write the registry timestamp once."""
+        written: list[Path] = []
+        monkeypatch.setattr(tasks_module, "_last_accessed_sent_at", {})
+        monkeypatch.setattr(tasks_module, "_write_project_last_accessed", written.append)
+
+        runner.invoke(task_app, ["create", "First", "Details"])
+        runner.invoke(task_app, ["create", "Second", "Details"])
+        tasks_module._join_pending_registry_updates()  # noqa: SLF001
+
+        assert written == [initialized_project.resolve()]
+
+    def test_registry_update_waits_for_in_flight_write(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a registry write still running absorbs later updates."""
+        release = threading.Event()
+        written: list[Path] = []
+
+        def _slow_write(project_root: Path) -> None:
+            release.wait(timeout=5)
+            written.append(project_root)
+
+        monkeypatch.setattr(tasks_module, "_LAST_ACCESSED_DEBOUNCE_SECONDS", 0.0)
+        monkeypatch.setattr(tasks_module, "_last_accessed_sent_at", {})
+        monkeypatch.setattr(tasks_module, "_write_project_last_accessed", _slow_write)
+
+        runner.invoke(task_app, ["create", "First", "Details"])
+        runner.invoke(task_app, ["create", "Second", "Details"])
+        release.set()
+        tasks_module._join_pending_registry_updates()  # noqa: SLF001
+
+        assert written == [initialized_project.resolve()]
+
+    def test_registry_file_records_last_accessed(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a task command really writes last_accessed to the registry."""
+        registry_path = tmp_path / "registry.json"
+        registered = ProjectRegistryService(registry_path).register_project(initialized_project)
+        monkeypatch.setattr(
+            tasks_module,
+            "get_project_registry_service",
+            lambda: ProjectRegistryService(registry_path),
+        )
+        monkeypatch.setattr(tasks_module, "_last_accessed_sent_at", {})
+
+        result = runner.invoke(task_app, ["create", "First", "Details"])
+        tasks_module._join_pending_registry_updates()  # noqa: SLF001
+
+        assert result.exit_code == 0
+        registry = ProjectRegistryService(registry_path).registry
+        project = registry.get_by_path(initialized_project.resolve())
+        assert project is not None
+        assert project.last_accessed > registered.last_accessed
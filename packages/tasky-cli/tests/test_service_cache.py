@@ -0,0 +1,72 @@
+"""Tests for the per-process task service cache used by task commands."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from tasky_cli.commands import tasks as tasks_module
+from tasky_cli.commands.projects import project_app
+from tasky_cli.commands.tasks import task_app
+from tasky_settings import create_task_service
+from typer.testing import CliRunner
+
+
+class TestTaskServiceCache:
+    """Test suite for task service reuse within a process."""
+
+    def test_service_is_reused_within_a_project(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,  # noqa: ARG002
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that consecutive commands in one process share the task service."""
+        created: list[Path] = []
+
+        def _counting_factory(project_root: Path) -> object:
+            created.append(project_root)
+            return create_task_service(project_root)
+
+        tasks_module.reset_service_cache()
+        monkeypatch.setattr(tasks_module, "create_task_service", _counting_factory)
+
+        runner.invoke(task_app, ["create", "First", "Details"])
+        result = runner.invoke(task_app, ["list"])
+
+        assert result.exit_code == 0
+        assert "First" in result.stdout
+        assert len(created) == 1
+        tasks_module.reset_service_cache()
+
+    def test_project_init_refreshes_cached_project_root(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that task commands use a project initialized after an earlier lookup."""
+        runner.invoke(task_app, ["create", "Outer task", "Belongs to the outer project"])
+        nested = initialized_project / "nested"
+        nested.mkdir()
+        monkeypatch.chdir(nested)
+        assert "Outer task" in runner.invoke(task_app, ["list"]).stdout
+
+        assert runner.invoke(project_app, ["init"]).exit_code == 0
+        result = runner.invoke(task_app, ["list"])
+
+        assert result.exit_code == 0
+        assert "No tasks to display" in result.stdout
+
+    def test_removed_project_is_not_served_from_cache(
+        self,
+        runner: CliRunner,
+        initialized_project: Path,
+    ) -> None:
+        """Test that deleting .tasky outside the CLI invalidates the cached root."""
+        assert runner.invoke(task_app, ["create", "Task", "Details"]).exit_code == 0
+
+        shutil.rmtree(initialized_project / ".tasky")
+        result = runner.invoke(task_app, ["list"])
+
+        assert result.exit_code == 1
+        assert "No project found" in result.stderr
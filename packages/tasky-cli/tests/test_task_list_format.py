@@ -1,5 +1,6 @@
 """Tests for enhanced task list formatting."""
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -484,3 +485,19 @@ class TestTaskListEdgeCases:
         assert "Task 1" in result.stdout
         assert "Task 2" in result.stdout
         assert "Task 3" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2025, 11, 12, 14, 30, 45, 123456, tzinfo=UTC),
+        datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        datetime(2025, 6, 7, 8, 9, 10, 999999, tzinfo=UTC),
+    ],
+)
+def test_timestamp_formatting_matches_strftime(value: datetime) -> None:
+    """Test that isoformat-based timestamp helpers match the documented formats."""
+    from tasky_cli.commands import tasks as tasks_module  # noqa: PLC0415
+
+    assert tasks_module._format_timestamp(value) == value.strftime("%Y-%m-%d %H:%M:%S")  # noqa: SLF001
+    assert tasks_module._format_iso_timestamp(value) == value.strftime("%Y-%m-%dT%H:%M:%SZ")  # noqa: SLF001
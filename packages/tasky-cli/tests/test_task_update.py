@@ -481,3 +481,100 @@ class TestTaskLifecycleErrorCases:
 
         assert result.exit_code == 1
         assert "Cannot transition" in result.stderr or "invalid" in result.stderr.lower()
+
+
+class TestTaskLifecycleMultipleIds:
+    """Test lifecycle commands that accept several task IDs."""
+
+    @staticmethod
+    def _create_task(runner: CliRunner, name: str) -> str:
+        result = runner.invoke(task_app, ["create", name, "Details"])
+        assert result.exit_code == 0
+        return next(
+            line.split("ID:")[1].strip()
+            for line in result.stdout.split("\n")
+            if line.startswith("ID:")
+        )
+
+    def test_complete_multiple_tasks(
+        self,
+        runner: CliRunner,
+        task_id: str,
+    ) -> None:
+        """Test that every listed task is completed in one invocation."""
+        second_id = self._create_task(runner, "Second Task")
+
+        result = runner.invoke(task_app, ["complete", task_id, second_id])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("✓ Task completed:") == 2
+        service = create_task_service()
+        assert service.get_task(UUID(task_id)).status.value == "completed"
+        assert service.get_task(UUID(second_id)).status.value == "completed"
+
+    def test_invalid_id_aborts_before_any_change(
+        self,
+        runner: CliRunner,
+        task_id: str,
+    ) -> None:
+        """Test that a malformed ID anywhere in the list changes no task."""
+        result = runner.invoke(task_app, ["complete", task_id, "not-a-uuid"])
+
+        assert result.exit_code == 1
+        assert "Invalid task ID" in result.stderr
+        service = create_task_service()
+        assert service.get_task(UUID(task_id)).status.value == "pending"
+
+    def test_processing_stops_at_first_error(
+        self,
+        runner: CliRunner,
+        task_id: str,
+    ) -> None:
+        """Test that tasks before a failing transition keep their new status."""
+        second_id = self._create_task(runner, "Second Task")
+        runner.invoke(task_app, ["complete", task_id])
+
+        result = runner.invoke(task_app, ["cancel", second_id, task_id])
+
+        assert result.exit_code == 1
+        assert "✗ Task cancelled: Second Task" in result.stdout
+        assert "Cannot transition" in result.stderr
+        service = create_task_service()
+        assert service.get_task(UUID(second_id)).status.value == "cancelled"
+        assert service.get_task(UUID(task_id)).status.value == "completed"
+
+    def test_repeated_id_is_processed_once(
+        self,
+        runner: CliRunner,
+        task_id: str,
+    ) -> None:
+        """Test that listing the same task twice completes it once and succeeds."""
+        result = runner.invoke(task_app, ["complete", task_id, task_id])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("✓ Task completed:") == 1
+        service = create_task_service()
+        assert service.get_task(UUID(task_id)).status.value == "completed"
+
+    def test_last_accessed_updated_when_later_id_fails(
+        self,
+        runner: CliRunner,
+        task_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the project access time is recorded after a partial batch."""
+        from tasky_cli.commands import tasks as tasks_module  # noqa: PLC0415
+
+        second_id = self._create_task(runner, "Second Task")
+        runner.invoke(task_app, ["complete", task_id])
+        calls: list[None] = []
+        monkeypatch.setattr(
+            tasks_module,
+            "_update_project_last_accessed",
+            lambda: calls.append(None),
+        )
+
+        result = runner.invoke(task_app, ["cancel", second_id, task_id])
+
+        assert result.exit_code == 1
+        assert len(calls) == 1
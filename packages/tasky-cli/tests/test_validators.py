@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 from uuid import UUID
 
@@ -38,6 +39,13 @@ class TestValidationResult:
         assert result.value == uuid_value
         assert isinstance(result.value, UUID)
 
+    def test_result_is_immutable(self) -> None:
+        """Test that a result cannot be modified after creation."""
+        result = ValidationResult[int].success(42)
+
+        with pytest.raises(FrozenInstanceError):
+            result.value = 7  # type: ignore[misc]
+
 
 class TestTaskIdValidator:
     """Tests for TaskIdValidator."""
@@ -152,6 +160,14 @@ class TestDateValidator:
         assert result.error_message is not None
         assert "Invalid date format" in result.error_message
 
+    def test_non_extended_iso_forms_rejected(self) -> None:
+        """Test that ISO forms other than YYYY-MM-DD are rejected."""
+        for date_str in ("20251231", "2025-W01-1", "2025-365"):
+            result = self.validator.validate(date_str)
+            assert not result.is_valid, f"Should reject: {date_str}"
+            assert result.error_message is not None
+            assert "Invalid date format" in result.error_message
+
     def test_invalid_date_values_rejected(self) -> None:
         """Test that dates with invalid values (e.g., month 13) are rejected."""
         result = self.validator.validate("2025-13-01")
@@ -53,6 +53,18 @@ class MCPConcurrencyError(MCPError):
     """Raised when concurrent request limit is exceeded."""
 
 
+# Exception → MCP error code, checked in order (specific → general).
+# Built once at import so error mapping does not rebuild the table per call.
+_ERROR_CODES: tuple[tuple[type[Exception], str], ...] = (
+    (MCPValidationError, "validation_error"),
+    (MCPAuthenticationError, "authentication_error"),
+    (MCPAuthorizationError, "authorization_error"),
+    (MCPTimeoutError, "timeout_error"),
+    (MCPConcurrencyError, "concurrency_error"),
+    (TaskDomainError, "task_error"),
+)
+
+
 def map_domain_error_to_mcp(error: Exception) -> dict[str, str]:
     """Map domain exceptions to MCP error responses.
 
@@ -63,16 +75,7 @@ def map_domain_error_to_mcp(error: Exception) -> dict[str, str]:
         Dictionary with 'code' and 'message' keys for MCP error response
 
     """
-    error_map = {
-        MCPValidationError: "validation_error",
-        MCPAuthenticationError: "authentication_error",
-        MCPAuthorizationError: "authorization_error",
-        MCPTimeoutError: "timeout_error",
-        MCPConcurrencyError: "concurrency_error",
-        TaskDomainError: "task_error",
-    }
-
-    for error_type, code in error_map.items():
+    for error_type, code in _ERROR_CODES:
         if isinstance(error, error_type):
             return {"code": code, "message": str(error)}
 
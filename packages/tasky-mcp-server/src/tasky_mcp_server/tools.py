@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 import tomllib
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -187,13 +188,9 @@ def project_info(service: TaskService, project_path: Path) -> ProjectInfoRespons
         ProjectInfoResponse with project metadata
 
     """
-    # Get task counts by status
-    all_tasks = service.get_all_tasks()
-    task_counts = {
-        "pending": sum(1 for t in all_tasks if t.status == TaskStatus.PENDING),
-        "completed": sum(1 for t in all_tasks if t.status == TaskStatus.COMPLETED),
-        "cancelled": sum(1 for t in all_tasks if t.status == TaskStatus.CANCELLED),
-    }
+    # Get task counts by status in a single pass (enum members hash by identity)
+    status_counts = Counter(t.status for t in service.get_all_tasks())
+    task_counts = {status.value: status_counts[status] for status in TaskStatus}
 
     description = _load_project_description(project_path)
 
@@ -11,6 +11,8 @@ from tasky_settings.factory import create_task_service
 from tasky_tasks.enums import TaskStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from tasky_tasks.models import TaskFilter, TaskModel
     from tasky_tasks.service import TaskService
 
@@ -42,6 +44,11 @@ class InMemoryTaskRepository:
         """Save a task (create or update)."""
         self._tasks[task.task_id] = task
 
+    def save_tasks(self, tasks: Sequence[TaskModel]) -> None:
+        """Save several tasks (create or update)."""
+        for task in tasks:
+            self._tasks[task.task_id] = task
+
     def get_task(self, task_id: UUID) -> TaskModel | None:
         """Get a task by ID."""
         return self._tasks.get(task_id)
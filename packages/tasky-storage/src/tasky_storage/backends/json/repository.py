@@ -21,6 +21,7 @@ from tasky_storage.backends.json.storage import JsonStorage
 from tasky_storage.errors import StorageDataError, StorageIOError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
     from uuid import UUID
 
@@ -52,6 +53,21 @@ class JsonTaskRepository(BaseModel):
         document.add_task(str(task.task_id), snapshot)
         self.storage.save(document.model_dump(mode="json"))
 
+    def save_tasks(self, tasks: Sequence[TaskModel]) -> None:
+        """Persist several task snapshots with a single document load and save."""
+        logger.debug("Saving tasks: count=%d", len(tasks))
+        if not tasks:
+            return
+
+        document = self._load_document_optional()
+        if document is None:
+            self.initialize()
+            document = TaskDocument.create_empty()
+
+        for task in tasks:
+            document.add_task(str(task.task_id), task_model_to_snapshot(task))
+        self.storage.save(document.model_dump(mode="json"))
+
     def get_task(self, task_id: UUID) -> TaskModel | None:
         """Retrieve a task by ID."""
         logger.debug("Getting task: id=%s", task_id)
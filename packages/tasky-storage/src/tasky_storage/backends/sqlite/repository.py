@@ -19,11 +19,34 @@ from tasky_storage.backends.sqlite.schema import create_schema, validate_schema
 from tasky_storage.errors import StorageDataError, StorageIOError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from tasky_tasks.models import TaskFilter, TaskModel, TaskStatus
 
 
 logger = get_logger("storage.sqlite.repository")
 
+_UPSERT_TASK_SQL = """
+    INSERT OR REPLACE INTO tasks (
+        task_id, name, details, status, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _task_row(task: TaskModel) -> tuple[Any, ...]:
+    """Return the ``_UPSERT_TASK_SQL`` parameters for ``task``."""
+    # task_model_to_snapshot uses mode='json' to get properly serialized values
+    # (enums as strings, datetimes as ISO format)
+    snapshot = task_model_to_snapshot(task)
+    return (
+        snapshot["task_id"],
+        snapshot["name"],
+        snapshot["details"],
+        snapshot["status"],
+        snapshot["created_at"],
+        snapshot["updated_at"],
+    )
+
 
 class SqliteTaskRepository:
     """SQLite-based task repository implementation."""
@@ -73,29 +96,10 @@ class SqliteTaskRepository:
         """
         logger.debug("Saving task: id=%s", task.task_id)
 
-        # Use mode='json' to get properly serialized values
-        # (enums as strings, datetimes as ISO format)
-        snapshot = task_model_to_snapshot(task)
-
         try:
             # Use connection as context manager for automatic rollback on error
             with get_connection(self.path) as conn, conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO tasks (
-                        task_id, name, details, status, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        snapshot["task_id"],
-                        snapshot["name"],
-                        snapshot["details"],
-                        snapshot["status"],
-                        snapshot["created_at"],
-                        snapshot["updated_at"],
-                    ),
-                )
+                conn.execute(_UPSERT_TASK_SQL, _task_row(task))
         except sqlite3.IntegrityError as exc:
             msg = f"Database integrity error saving task {task.task_id}: {exc}"
             raise StorageDataError(msg, cause=exc) from exc
@@ -106,6 +110,40 @@ class SqliteTaskRepository:
             msg = f"Database error saving task {task.task_id}: {exc}"
             raise StorageIOError(msg, cause=exc) from exc
 
+    def save_tasks(self, tasks: Sequence[TaskModel]) -> None:
+        """Persist several task snapshots in a single transaction.
+
+        Parameters
+        ----------
+        tasks:
+            Task models to persist
+
+        Raises
+        ------
+        StorageError:
+            If database operation fails; no task is saved in that case
+
+        """
+        logger.debug("Saving tasks: count=%d", len(tasks))
+        if not tasks:
+            return
+
+        rows = [_task_row(task) for task in tasks]
+
+        try:
+            # One transaction (and one commit) for the whole batch
+            with get_connection(self.path) as conn, conn:
+                conn.executemany(_UPSERT_TASK_SQL, rows)
+        except sqlite3.IntegrityError as exc:
+            msg = f"Database integrity error saving {len(rows)} tasks: {exc}"
+            raise StorageDataError(msg, cause=exc) from exc
+        except sqlite3.OperationalError as exc:
+            msg = f"Database locked or inaccessible: {exc}"
+            raise StorageIOError(msg, cause=exc) from exc
+        except sqlite3.Error as exc:
+            msg = f"Database error saving {len(rows)} tasks: {exc}"
+            raise StorageIOError(msg, cause=exc) from exc
+
     def get_task(self, task_id: UUID) -> TaskModel | None:
         """Retrieve a task by ID.
 
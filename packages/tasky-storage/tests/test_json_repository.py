@@ -44,6 +44,23 @@ class TestJsonTaskRepository:
         assert retrieved.details == "Test details"
         assert retrieved.status == TaskStatus.PENDING
 
+    def test_save_tasks_persists_all_in_one_write(self, repo: JsonTaskRepository) -> None:
+        """Test that save_tasks stores a batch and replaces existing IDs."""
+        existing = TaskModel(name="Existing", details="Old details")
+        repo.save_task(existing)
+        existing.details = "New details"
+        new_task = TaskModel(name="New", details="Details")
+
+        repo.save_tasks([existing, new_task])
+
+        assert {task.task_id for task in repo.get_all_tasks()} == {
+            existing.task_id,
+            new_task.task_id,
+        }
+        retrieved = repo.get_task(existing.task_id)
+        assert retrieved is not None
+        assert retrieved.details == "New details"
+
     def test_get_nonexistent_task_returns_none(self, repo: JsonTaskRepository) -> None:
         """Test that getting a non-existent task returns None."""
         nonexistent_id = uuid4()
@@ -41,6 +41,25 @@ class TestSqliteTaskRepository:
         assert retrieved.details == task.details
         assert retrieved.status == task.status
 
+    def test_save_tasks_persists_all_in_one_transaction(self, tmp_path: Path) -> None:
+        """Test that save_tasks stores a batch and replaces existing IDs."""
+        repo = SqliteTaskRepository(path=tmp_path / "tasks.db")
+        repo.initialize()
+        existing = TaskModel(name="Existing", details="Old details")
+        repo.save_task(existing)
+        existing.details = "New details"
+        new_task = TaskModel(name="New", details="Details")
+
+        repo.save_tasks([existing, new_task])
+
+        assert {task.task_id for task in repo.get_all_tasks()} == {
+            existing.task_id,
+            new_task.task_id,
+        }
+        retrieved = repo.get_task(existing.task_id)
+        assert retrieved is not None
+        assert retrieved.details == "New details"
+
     def test_get_nonexistent_task_returns_none(self, tmp_path: Path) -> None:
         """Test retrieving a task that doesn't exist."""
         db_path = tmp_path / "tasks.db"
@@ -50,6 +50,8 @@ class TaskNotFoundError(TaskDomainError):
 class TaskValidationError(TaskDomainError):
     """Raised when task data fails validation rules."""
 
+    field: str | None = None
+
     def __init__(self, message: str | None = None, *, field: str | None = None) -> None:
         self.field = field
         default_message = message or "Task validation failed."
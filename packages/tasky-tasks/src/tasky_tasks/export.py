@@ -6,14 +6,14 @@ with support for multiple merge strategies (append, replace, merge).
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_json
 from tasky_logging import get_logger  # type: ignore[import-untyped]
 
 from tasky_tasks.exceptions import (
@@ -23,6 +23,7 @@ from tasky_tasks.exceptions import (
     TaskImportError,
 )
 from tasky_tasks.models import TaskModel, TaskStatus
+from tasky_tasks.ports import BulkTaskRepository
 
 if TYPE_CHECKING:
     from tasky_tasks.service import TaskService
@@ -76,6 +77,8 @@ class ImportResult(BaseModel):
 
     Provides comprehensive feedback about what happened during import,
     including counts of created, updated, and skipped tasks, plus any errors.
+    ``errors`` keeps at most ``TaskImportExportService.MAX_RECORDED_ERRORS``
+    messages; ``skipped`` always counts every failed task.
     """
 
     total_processed: int = Field(..., description="Total tasks processed")
@@ -98,6 +101,9 @@ class TaskImportExportService:
     # Supported format version
     CURRENT_VERSION = "1.0"
 
+    # Error messages kept on ImportResult; further failures are only counted
+    MAX_RECORDED_ERRORS = 100
+
     def __init__(self, task_service: TaskService) -> None:
         """Initialize the import/export service.
 
@@ -114,6 +120,7 @@ class TaskImportExportService:
         file_path: Path,
         *,
         project_name: str = "default",
+        compact: bool = False,
     ) -> ExportDocument:
         """Export all tasks to a JSON file.
 
@@ -123,6 +130,9 @@ class TaskImportExportService:
             Path where the JSON export file will be written.
         project_name:
             Name of the source project (for metadata only).
+        compact:
+            If True, write the JSON without indentation. The file is smaller
+            and faster to write, and imports exactly like the indented form.
 
         Returns
         -------
@@ -153,16 +163,13 @@ class TaskImportExportService:
                 tasks=snapshots,
             )
 
+            # Serialize straight to UTF-8 JSON bytes with pydantic-core, so the
+            # payload is never decoded to str and re-encoded for the write
+            payload = to_json(export_doc, indent=None if compact else 2)
+
             # Write to file
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(
-                    export_doc.model_dump(mode="json"),
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    default=str,
-                )
+            file_path.write_bytes(payload)
         except OSError as exc:
             msg = f"Failed to write export file: {exc}"
             logger.exception(msg)
@@ -271,8 +278,8 @@ class TaskImportExportService:
             logger.error(msg)
             raise TaskImportError(msg)
 
-        data = self._load_json_file(file_path)
-        export_doc = self._validate_export_schema(data)
+        raw = self._read_import_file(file_path)
+        export_doc = self._validate_export_schema(raw)
         self._check_version_compatibility(export_doc)
 
         logger.debug(
@@ -283,8 +290,8 @@ class TaskImportExportService:
 
         return export_doc
 
-    def _load_json_file(self, file_path: Path) -> dict[str, Any]:
-        """Load JSON data from file.
+    def _read_import_file(self, file_path: Path) -> bytes:
+        """Read the raw contents of an import file.
 
         Parameters
         ----------
@@ -293,36 +300,33 @@ class TaskImportExportService:
 
         Returns
         -------
-        dict:
-            The parsed JSON data.
+        bytes:
+            The undecoded file contents.
 
         Raises
         ------
         TaskImportError:
             Raised when the file cannot be read.
-        InvalidExportFormatError:
-            Raised when the JSON is malformed.
 
         """
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return file_path.read_bytes()
         except OSError as exc:
             msg = f"Failed to read import file: {exc}"
             logger.exception(msg)
             raise TaskImportError(msg) from exc
-        except json.JSONDecodeError as exc:
-            msg = f"Invalid JSON in import file: {exc}"
-            logger.exception(msg)
-            raise InvalidExportFormatError(msg) from exc
 
-    def _validate_export_schema(self, data: dict[str, Any]) -> ExportDocument:
-        """Validate data against export schema.
+    def _validate_export_schema(self, raw: bytes) -> ExportDocument:
+        """Parse and validate raw JSON against the export schema.
+
+        The document is validated directly from the JSON bytes, so no
+        intermediate ``dict`` tree of the whole file is built before the
+        snapshots are created.
 
         Parameters
         ----------
-        data:
-            The JSON data to validate.
+        raw:
+            The raw JSON bytes to validate.
 
         Returns
         -------
@@ -332,13 +336,16 @@ class TaskImportExportService:
         Raises
         ------
         InvalidExportFormatError:
-            Raised when validation fails.
+            Raised when the JSON is malformed or validation fails.
 
         """
         try:
-            return ExportDocument.model_validate(data)
+            return ExportDocument.model_validate_json(raw)
         except ValidationError as exc:
-            msg = f"Invalid export format: {exc}"
+            if any(error["type"] == "json_invalid" for error in exc.errors(include_url=False)):
+                msg = f"Invalid JSON in import file: {exc}"
+            else:
+                msg = f"Invalid export format: {exc}"
             logger.exception(msg)
             raise InvalidExportFormatError(msg) from exc
 
@@ -385,38 +392,81 @@ class TaskImportExportService:
 
         """
         created_count = 0
+        skipped_count = 0
         errors: list[str] = []
 
         # Get existing task IDs
         existing_tasks = self.task_service.get_all_tasks()
         existing_ids = {task.task_id for task in existing_tasks}
 
+        tasks_to_save: list[TaskModel] = []
+
         for snapshot in export_doc.tasks:
             try:
                 task = self._snapshot_to_task(snapshot)
                 task = self._rekey_if_duplicate(task, existing_ids)
 
-                if not dry_run:
-                    self.task_service.repository.save_task(task)
-
+                tasks_to_save.append(task)
                 created_count += 1
                 existing_ids.add(task.task_id)  # Track for subsequent imports in same batch
 
             except (TaskImportError, ValueError, ValidationError) as exc:
                 # Expected import errors: validation failures, data issues
-                error_msg = f"Failed to import task '{snapshot.task_id}': {exc}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
+                skipped_count += 1
+                self._record_import_error(
+                    errors,
+                    f"Failed to import task '{snapshot.task_id}': {exc}",
+                )
             # Let programmer errors (TypeError, AttributeError, KeyError) propagate
 
+        self._save_imported_tasks(tasks_to_save, dry_run=dry_run)
+
         return ImportResult(
             total_processed=len(export_doc.tasks),
             created=created_count,
             updated=0,
-            skipped=len(errors),
+            skipped=skipped_count,
             errors=errors,
         )
 
+    def _save_imported_tasks(self, tasks: list[TaskModel], *, dry_run: bool) -> None:
+        """Persist the validated tasks of an import in one repository call.
+
+        Repositories that are not a ``BulkTaskRepository`` are written with
+        one ``save_task`` call per task.
+
+        Parameters
+        ----------
+        tasks:
+            Tasks that passed conversion and should be stored.
+        dry_run:
+            If True, nothing is written.
+
+        """
+        if dry_run:
+            return
+        repository = self.task_service.repository
+        if isinstance(repository, BulkTaskRepository):
+            repository.save_tasks(tasks)
+            return
+        for task in tasks:
+            repository.save_task(task)
+
+    def _record_import_error(self, errors: list[str], message: str) -> None:
+        """Log an import failure and keep its message while under the cap.
+
+        Parameters
+        ----------
+        errors:
+            Error messages collected so far for the current import.
+        message:
+            Description of the failed task import.
+
+        """
+        logger.warning(message)
+        if len(errors) < self.MAX_RECORDED_ERRORS:
+            errors.append(message)
+
     def _rekey_if_duplicate(self, task: TaskModel, existing_ids: set[UUID]) -> TaskModel:
         """Re-key task if its ID already exists.
 
@@ -485,12 +535,14 @@ class TaskImportExportService:
         """
         created_count = 0
         updated_count = 0
+        skipped_count = 0
         errors: list[str] = []
 
         # Get existing task IDs and map for preserving created_at
         existing_tasks = self.task_service.get_all_tasks()
         existing_ids = {task.task_id for task in existing_tasks}
         existing_tasks_by_id = {task.task_id: task for task in existing_tasks}
+        tasks_to_save: list[TaskModel] = []
 
         for snapshot in export_doc.tasks:
             try:
@@ -504,8 +556,7 @@ class TaskImportExportService:
                     existing_tasks_by_id=existing_tasks_by_id,
                 )
 
-                if not dry_run:
-                    self.task_service.repository.save_task(task)
+                tasks_to_save.append(task)
 
                 if is_update:
                     updated_count += 1
@@ -516,16 +567,20 @@ class TaskImportExportService:
 
             except (TaskImportError, ValueError, ValidationError) as exc:
                 # Expected import errors: validation failures, data issues
-                error_msg = f"Failed to import task '{snapshot.task_id}': {exc}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
+                skipped_count += 1
+                self._record_import_error(
+                    errors,
+                    f"Failed to import task '{snapshot.task_id}': {exc}",
+                )
             # Let programmer errors (TypeError, AttributeError, KeyError) propagate
 
+        self._save_imported_tasks(tasks_to_save, dry_run=dry_run)
+
         return ImportResult(
             total_processed=len(export_doc.tasks),
             created=created_count,
             updated=updated_count,
-            skipped=len(errors),
+            skipped=skipped_count,
             errors=errors,
         )
 
@@ -617,26 +672,32 @@ class TaskImportExportService:
 
         """
         created_count = 0
+        skipped_count = 0
         errors: list[str] = []
 
+        tasks_to_save: list[TaskModel] = []
+
         for snapshot in export_doc.tasks:
             try:
                 task = self._snapshot_to_task(snapshot)
-                if not dry_run:
-                    self.task_service.repository.save_task(task)
+                tasks_to_save.append(task)
                 created_count += 1
             except (TaskImportError, ValueError, ValidationError) as exc:
                 # Expected import errors: validation failures, data issues
-                error_msg = f"Failed to import task '{snapshot.task_id}': {exc}"
-                logger.warning(error_msg)
-                errors.append(error_msg)
+                skipped_count += 1
+                self._record_import_error(
+                    errors,
+                    f"Failed to import task '{snapshot.task_id}': {exc}",
+                )
             # Let programmer errors (TypeError, AttributeError, KeyError) propagate
 
+        self._save_imported_tasks(tasks_to_save, dry_run=dry_run)
+
         return ImportResult(
             total_processed=len(export_doc.tasks),
             created=created_count,
             updated=0,
-            skipped=len(errors),
+            skipped=skipped_count,
             errors=errors,
         )
 
@@ -1,8 +1,11 @@
 """Repository port definitions for task persistence operations."""
 
-from typing import TYPE_CHECKING, Protocol
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from uuid import UUID
 
     from tasky_tasks.models import TaskFilter, TaskModel, TaskStatus
@@ -70,3 +73,23 @@ class TaskRepository(Protocol):
     def task_exists(self, task_id: UUID) -> bool:
         """Determine whether a task exists in storage."""
         ...
+
+
+@runtime_checkable
+class BulkTaskRepository(Protocol):
+    """Optional repository capability for persisting many tasks at once.
+
+    Backends that implement it let imports write in a single storage
+    operation; others are written through ``TaskRepository.save_task``.
+    """
+
+    def save_tasks(self, tasks: Sequence[TaskModel]) -> None:
+        """Persist several tasks in a single storage operation.
+
+        Parameters
+        ----------
+        tasks:
+            Tasks to create or replace, keyed by their ``task_id``.
+
+        """
+        ...
@@ -10,6 +10,7 @@ if __name__ == "tests.conftest":
     module.__name__ = "tasky_tasks.tests.conftest"
     sys.modules[module.__name__] = module
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from tasky_tasks.models import TaskFilter, TaskModel, TaskStatus
@@ -69,6 +70,11 @@ class InMemoryTaskRepository:
         """Persist a task to in-memory storage."""
         self.tasks[task.task_id] = task
 
+    def save_tasks(self, tasks: Sequence[TaskModel]) -> None:
+        """Persist several tasks to in-memory storage."""
+        for task in tasks:
+            self.tasks[task.task_id] = task
+
     def get_task(self, task_id: UUID) -> TaskModel | None:
         """Retrieve task by ID, or None if not found."""
         return self.tasks.get(task_id)
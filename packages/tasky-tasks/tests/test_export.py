@@ -24,8 +24,11 @@ from tasky_tasks.export import (
     TaskSnapshot,
 )
 from tasky_tasks.models import TaskModel, TaskStatus
+from tasky_tasks.ports import BulkTaskRepository
 from tasky_tasks.service import TaskService
 
+from .conftest import InMemoryTaskRepository
+
 
 @pytest.fixture
 def task_service(tmp_path: Path) -> TaskService:
@@ -340,6 +343,37 @@ class TestImportTasks:
         all_tasks = task_service.get_all_tasks()
         assert len(all_tasks) == 2
 
+    def test_import_falls_back_to_save_task_without_bulk_save(
+        self,
+        tmp_path: Path,
+        sample_task: TaskModel,
+    ) -> None:
+        """Test that repositories without bulk saves are written task by task."""
+
+        class _SingleSaveRepository(InMemoryTaskRepository):
+            # None opts the class out of the BulkTaskRepository protocol
+            save_tasks = None  # type: ignore[assignment]
+
+        repository = _SingleSaveRepository()
+        assert not isinstance(repository, BulkTaskRepository)
+        service = TaskImportExportService(TaskService(repository))
+        export_file = tmp_path / "import.json"
+        snapshot = TaskSnapshot(
+            task_id=sample_task.task_id,
+            name=sample_task.name,
+            details=sample_task.details,
+            status=sample_task.status,
+            created_at=sample_task.created_at,
+            updated_at=sample_task.updated_at,
+        )
+        doc = ExportDocument(task_count=1, tasks=[snapshot])
+        export_file.write_text(doc.model_dump_json())
+
+        result = service.import_tasks(export_file, strategy="append")
+
+        assert result.created == 1
+        assert repository.task_exists(sample_task.task_id)
+
     def test_import_replace_strategy(
         self,
         task_service: TaskService,
@@ -487,6 +521,32 @@ class TestImportTasks:
         all_tasks = task_service.get_all_tasks()
         assert len(all_tasks) == 0
 
+    @pytest.mark.parametrize("strategy", ["append", "replace", "merge"])
+    def test_import_dry_run_never_writes(
+        self,
+        task_service: TaskService,
+        export_service: TaskImportExportService,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        strategy: str,
+    ) -> None:
+        """Test that dry runs of every strategy skip all repository writes."""
+        existing = task_service.create_task("Existing", "Details")
+        export_file = tmp_path / "import.json"
+        export_service.export_tasks(export_file)
+
+        def _unexpected_write(*_args: object, **_kwargs: object) -> None:
+            pytest.fail("dry run must not write to the repository")
+
+        monkeypatch.setattr(JsonTaskRepository, "save_tasks", _unexpected_write)
+        monkeypatch.setattr(JsonTaskRepository, "delete_task", _unexpected_write)
+
+        result = export_service.import_tasks(export_file, strategy=strategy, dry_run=True)
+
+        assert result.total_processed == 1
+        assert result.skipped == 0
+        assert [task.task_id for task in task_service.get_all_tasks()] == [existing.task_id]
+
     def test_import_invalid_strategy(
         self,
         export_service: TaskImportExportService,
@@ -505,6 +565,46 @@ class TestImportTasks:
         with pytest.raises(TaskImportError, match="Invalid import strategy"):
             export_service.import_tasks(export_file, strategy="invalid")
 
+    def test_import_caps_recorded_errors_but_counts_all(
+        self,
+        export_service: TaskImportExportService,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that failed tasks are all counted while only a few messages are kept."""
+        export_file = tmp_path / "import.json"
+        now = datetime.now(tz=UTC)
+        snapshots = [
+            TaskSnapshot(
+                task_id=uuid4(),
+                name=f"Task {index}",
+                details="Details",
+                status=TaskStatus.PENDING,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(5)
+        ]
+        doc = ExportDocument(task_count=len(snapshots), tasks=snapshots)
+        export_file.write_text(doc.model_dump_json())
+
+        def _failing_conversion(
+            _service: TaskImportExportService,
+            snapshot: TaskSnapshot,
+        ) -> TaskModel:
+            msg = f"cannot convert {snapshot.name}"
+            raise ValueError(msg)
+
+        monkeypatch.setattr(TaskImportExportService, "MAX_RECORDED_ERRORS", 2)
+        monkeypatch.setattr(TaskImportExportService, "_snapshot_to_task", _failing_conversion)
+
+        result = export_service.import_tasks(export_file, strategy="append")
+
+        assert result.created == 0
+        assert result.skipped == 5
+        assert len(result.errors) == 2
+        assert "cannot convert Task 0" in result.errors[0]
+
 
 class TestRoundTripImportExport:
     """Tests for round-trip import/export."""
@@ -548,3 +648,26 @@ class TestRoundTripImportExport:
         assert task_map[task1.task_id].status == TaskStatus.PENDING
         assert task_map[task2.task_id].status == TaskStatus.COMPLETED
         assert task_map[task3.task_id].status == TaskStatus.CANCELLED
+
+    def test_round_trip_keeps_non_ascii_text_unescaped(
+        self,
+        task_service: TaskService,
+        export_service: TaskImportExportService,
+        tmp_path: Path,
+    ) -> None:
+        """Test that non-ASCII task text is written as UTF-8 and read back intact."""
+        task = task_service.create_task("Café ✓", "Détails — naïve")
+
+        export_file = tmp_path / "export.json"
+        export_service.export_tasks(export_file)
+
+        content = export_file.read_text(encoding="utf-8")
+        assert "Café ✓" in content
+        assert "\\u" not in content
+
+        task_service.delete_task(task.task_id)
+        export_service.import_tasks(export_file)
+
+        restored = task_service.get_task(task.task_id)
+        assert restored.name == "Café ✓"
+        assert restored.details == "Détails — naïve"